@@ -7,62 +7,192 @@ employees (HR), products, customers, suppliers, sales, purchases, production,
 cash flow, budgets, and payroll.
 
 Output: CSV files in ./financial_dataset/
+  POLARS_FAST_IO=1  – write CSVs with Polars' parallel writer (requires polars)
+  WRITE_PARQUET=1   – also write a zstd .parquet next to each CSV (requires pyarrow)
 """
 
 import os
-import random
 import datetime
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 import pandas as pd
 from faker import Faker
 
 fake = Faker('cs_CZ')
 Faker.seed(42)
-np.random.seed(42)
-random.seed(42)
+# Single source of randomness for all generators; reseeded per fact-table worker
+rng = np.random.default_rng(42)
 
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'financial_dataset')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+POLARS_FAST_IO = os.getenv('POLARS_FAST_IO') == '1'
+WRITE_PARQUET = os.getenv('WRITE_PARQUET') == '1'
+
 DATE_START = datetime.date(2023, 1, 1)
 DATE_END = datetime.date(2025, 12, 31)
 TOTAL_DAYS = (DATE_END - DATE_START).days + 1
+# Monthly reporting periods ('YYYY-MM') covered by payroll and budget
+OBDOBI = np.array([f'{year}-{month:02d}' for year in range(DATE_START.year, DATE_END.year + 1)
+                   for month in range(1, 13)])
+
+# Faker costs ~100µs per call, so text fields are sampled from pools of values.
+# Pools are built on first use: fact-table workers only ever need 'sentence'.
+POOL_SIZE = 2000
+_POOL_FAKERS = {
+    'sentence': lambda: fake.sentence(nb_words=4)[:60],
+    'catch_phrase': fake.catch_phrase,
+    'company': lambda: fake.company()[:50],
+    'address': fake.street_address,
+    'city': fake.city,
+    'first_name': fake.first_name,
+    'last_name': fake.last_name,
+    'email': fake.email,
+}
+
+@functools.lru_cache(maxsize=None)
+def faker_pool(kind):
+    """Up to POOL_SIZE distinct Faker values of one kind, built once per process.
+
+    Deduplicated, so drawing with ``replace=False`` gives distinct values and not
+    just distinct pool positions.
+    """
+    return np.unique([_POOL_FAKERS[kind]() for _ in range(POOL_SIZE)])
 
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
 
+def shift_days(start, days):
+    """``datetime64[D]`` array of ``start`` plus an integer array of day offsets."""
+    return np.datetime64(start, 'D') + np.asarray(days).astype('timedelta64[D]')
+
 def random_dates(n, start=DATE_START, end=DATE_END):
-    days = np.random.randint(0, (end - start).days + 1, size=n)
-    return [start + datetime.timedelta(int(d)) for d in days]
+    """Uniform dates as a ``datetime64[D]`` array; use ``.astype(str)`` for ISO strings."""
+    return shift_days(start, rng.integers(0, (end - start).days + 1, size=n, dtype='i4'))
 
 def seasonal_dates(n, start=DATE_START, end=DATE_END):
-    """Generate dates with seasonal bias (more in Q4, less in Q1)."""
-    total = (end - start).days + 1
-    weights = []
-    for d in range(total):
-        dt = start + datetime.timedelta(d)
-        month = dt.month
-        if month in (10, 11, 12):
-            w = 1.6
-        elif month in (7, 8, 9):
-            w = 1.1
-        elif month in (4, 5, 6):
-            w = 1.0
-        else:
-            w = 0.7
-        weights.append(w)
-    weights = np.array(weights)
+    """Generate dates with seasonal bias (more in Q4, less in Q1).
+
+    Returns a ``datetime64[D]`` array; use ``.astype(str)`` for ISO strings.
+    """
+    start = np.datetime64(start, 'D')
+    calendar = np.arange(start, np.datetime64(end, 'D') + 1)
+    months = calendar.astype('datetime64[M]').astype(int) % 12 + 1
+    weights = np.select([months >= 10, months >= 7, months >= 4], [1.6, 1.1, 1.0], default=0.7)
     weights /= weights.sum()
-    days = np.random.choice(total, size=n, p=weights)
-    return [start + datetime.timedelta(int(d)) for d in days]
+    days = rng.choice(calendar.size, size=n, p=weights)
+    return shift_days(start, days)
+
+def round2(arr):
+    """Round a freshly computed float array to cents in place and return it."""
+    return np.round(arr, 2, out=arr)
+
+# Payroll contribution and tax rates (share of gross wage)
+SOC_ZAM_RATE = 0.065    # employee social
+ZDR_ZAM_RATE = 0.045    # employee health
+SOC_FIRMA_RATE = 0.248  # employer social
+ZDR_FIRMA_RATE = 0.09   # employer health
+DAN_RATE = 0.15         # income tax
+
+def payroll_taxes(hruba):
+    """Contributions, income tax and net wage for a flat array of gross wages.
+
+    Returns (soc_zam, zdr_zam, soc_firm, zdr_firm, dan, cista).
+    """
+    soc_zam = round2(hruba * SOC_ZAM_RATE)
+    zdr_zam = round2(hruba * ZDR_ZAM_RATE)
+    soc_firm = round2(hruba * SOC_FIRMA_RATE)
+    zdr_firm = round2(hruba * ZDR_FIRMA_RATE)
+    dan = round2(np.maximum(0, (hruba - soc_zam - zdr_zam) * DAN_RATE))
+    cista = round2(hruba - soc_zam - zdr_zam - dan)
+    return soc_zam, zdr_zam, soc_firm, zdr_firm, dan, cista
+
+def choice_categorical(values, n, p=None):
+    """Draw n values as a pd.Categorical (integer codes + a small categories table).
+
+    Repeated entries in ``values`` act as weights, like with ``rng.choice``;
+    alternatively pass explicit probabilities ``p`` for unique values.
+    """
+    if p is None:
+        cats, counts = np.unique(np.asarray(values), return_counts=True)
+        p = counts / counts.sum()
+    else:
+        cats = np.asarray(values)
+    return pd.Categorical.from_codes(rng.choice(len(cats), n, p=p), categories=cats)
+
+def make_ids(prefix, n, width, start=1):
+    """Vectorized f'{prefix}{i:0{width}d}' for i in start..start+n-1."""
+    nums = np.arange(start, start + n).astype(str)
+    return np.char.add(prefix, np.char.zfill(nums, width))
+
+def _to_polars(df):
+    """pandas -> Polars for CSV output, with empty strings turned into nulls.
+
+    pandas writes '' as an empty field but Polars quotes it as "", so without this
+    the two writers disagree on e.g. fact_transakce.popis.
+    """
+    import polars as pl
+    return pl.from_pandas(df).with_columns(pl.col(pl.String).replace('', None))
 
 def save(df, name):
+    """Write df to OUTPUT_DIR/name and return it.
+
+    The pandas and POLARS_FAST_IO writers are interchangeable: both produce
+    byte-identical CSV files.
+    """
     path = os.path.join(OUTPUT_DIR, name)
-    df.to_csv(path, index=False, encoding='utf-8-sig')
+    if POLARS_FAST_IO:
+        _to_polars(df).write_csv(path, include_bom=True)
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+    if WRITE_PARQUET:
+        df.to_parquet(path.replace('.csv', '.parquet'), index=False,
+                      compression='zstd', engine='pyarrow')
     print(f"  ✓ {name}: {len(df):>10,} rows, {len(df.columns):>3} cols")
     return df
 
+def save_chunks(chunks, name):
+    """Like save(), but streams an iterable of DataFrames into one file chunk by chunk.
+
+    Only one chunk is held in memory at a time; the full table is never concatenated.
+    As in save(), the pandas and Polars writers produce byte-identical files.
+    """
+    path = os.path.join(OUTPUT_DIR, name)
+    parquet_path = path.replace('.csv', '.parquet')
+    parquet_writer = None
+    rows = cols = 0
+    try:
+        for df in chunks:
+            first = rows == 0
+            if POLARS_FAST_IO:
+                with open(path, 'wb' if first else 'ab') as f:
+                    _to_polars(df).write_csv(f, include_header=first, include_bom=first)
+            else:
+                df.to_csv(path, mode='w' if first else 'a', header=first, index=False,
+                          encoding='utf-8-sig' if first else 'utf-8')
+            if WRITE_PARQUET:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = pq.ParquetWriter(parquet_path, table.schema, compression='zstd')
+                parquet_writer.write_table(table)
+            rows += len(df)
+            cols = len(df.columns)
+    finally:
+        # Write the footer even if a chunk failed, so the .parquet stays readable
+        if parquet_writer is not None:
+            parquet_writer.close()
+    if rows == 0:
+        # No chunks: truncate rather than leave a stale file from an earlier run
+        open(path, 'w').close()
+        if WRITE_PARQUET and os.path.exists(parquet_path):
+            os.remove(parquet_path)
+    print(f"  ✓ {name}: {rows:>10,} rows, {cols:>3} cols")
+
 # ============================================================
 # 1. DIMENSION TABLES
 # ============================================================
@@ -78,7 +208,6 @@ def gen_regiony():
     return save(pd.DataFrame(data, columns=['region_id','region_nazev','zeme']), 'dim_regiony.csv')
 
 def gen_pobocky(regiony):
-    rows = []
     mesta = {
         'REG01': ['Praha 1','Praha 4','Praha 8'],
         'REG02': ['Kladno','Mladá Boleslav','Kolín'],
@@ -91,51 +220,63 @@ def gen_pobocky(regiony):
         'REG09': ['Bratislava I','Bratislava III','Pezinok'],
         'REG10': ['Wien Zentrum','Wien Nord','Wien Süd'],
     }
-    for i, (rid, cities) in enumerate(mesta.items()):
-        for j, city in enumerate(cities):
-            pid = f'POB{i*3+j+1:02d}'
-            rows.append((pid, f'Pobočka {city}', fake.street_address(), city, rid,
-                          random.choice(['aktivní','aktivní','aktivní','plánovaná'])))
-    return save(pd.DataFrame(rows, columns=['pobocka_id','pobocka_nazev','adresa','mesto','region_id','stav']),
-                'dim_pobocky.csv')
+    city = np.array([c for cities in mesta.values() for c in cities])
+    n = len(city)
+    return save(pd.DataFrame({
+        'pobocka_id': make_ids('POB', n, 2),
+        'pobocka_nazev': np.char.add('Pobočka ', city),
+        'adresa': rng.choice(faker_pool('address'), n, replace=False),
+        'mesto': city,
+        'region_id': np.repeat(list(mesta), [len(c) for c in mesta.values()]),
+        'stav': rng.choice(['aktivní','aktivní','aktivní','plánovaná'], n),
+    }), 'dim_pobocky.csv')
 
 def gen_strediska(pobocky):
-    typy = ['Výroba','Obchod','Administrativa','IT','Logistika','Finance','Marketing','HR','Kvalita','R&D']
-    rows = []
-    for i in range(50):
-        sid = f'STR{i+1:03d}'
-        typ = typy[i % len(typy)]
-        parent = f'STR{random.randint(1, max(1, i)):03d}' if i > 0 else None
-        pob = random.choice(pobocky['pobocka_id'].tolist())
-        rows.append((sid, f'{typ} - oddělení {i+1}', typ, parent, pob,
-                      random.choice(['aktivní','aktivní','neaktivní'])))
-    return save(pd.DataFrame(rows, columns=['stredisko_id','stredisko_nazev','typ','nadrazene_stredisko','pobocka_id','stav']),
-                'dim_strediska.csv')
+    typy = np.array(['Výroba','Obchod','Administrativa','IT','Logistika','Finance','Marketing','HR','Kvalita','R&D'])
+    n = 50
+    typ = typy[np.arange(n) % len(typy)]
+    # Each center after the first reports to one of STR001..STR{i}
+    parent = np.full(n, None, dtype=object)
+    parent[1:] = make_ids('STR', n - 1, 3)[rng.integers(0, np.arange(1, n))]
+    return save(pd.DataFrame({
+        'stredisko_id': make_ids('STR', n, 3),
+        'stredisko_nazev': [f'{t} - oddělení {i+1}' for i, t in enumerate(typ)],
+        'typ': typ,
+        'nadrazene_stredisko': parent,
+        'pobocka_id': rng.choice(pobocky['pobocka_id'].to_numpy(), n),
+        'stav': rng.choice(['aktivní','aktivní','neaktivní'], n),
+    }), 'dim_strediska.csv')
 
 def gen_profit_centra(regiony):
-    rows = []
     nazvy = ['Retail CZ','Wholesale CZ','E-commerce','B2B International','Services CZ',
              'Retail SK','Manufacturing','Consulting','Logistics','Financial Services',
              'IT Solutions','Custom Products','Maintenance','After-sales','Export EU',
              'Government','Energy','Healthcare','Automotive','Ostatní']
-    for i in range(20):
-        rows.append((f'PC{i+1:02d}', nazvy[i], random.choice(regiony['region_id'].tolist()),
-                      fake.name(), random.choice(['aktivní','aktivní','neaktivní']),
-                      round(random.uniform(500000, 50000000), 2)))
-    return save(pd.DataFrame(rows, columns=['profit_centrum_id','nazev','region_id','manazer','stav','rocni_cil']),
-                'dim_profit_centra.csv')
+    n = len(nazvy)
+    return save(pd.DataFrame({
+        'profit_centrum_id': make_ids('PC', n, 2),
+        'nazev': nazvy,
+        'region_id': rng.choice(regiony['region_id'].to_numpy(), n),
+        'manazer': np.char.add(np.char.add(rng.choice(faker_pool('first_name'), n), ' '),
+                               rng.choice(faker_pool('last_name'), n)),
+        'stav': rng.choice(['aktivní','aktivní','neaktivní'], n),
+        'rocni_cil': round2(rng.uniform(500000, 50000000, n)),
+    }), 'dim_profit_centra.csv')
 
 def gen_projekty():
     stavy = ['Plánovaný','Aktivní','Aktivní','Aktivní','Pozastavený','Dokončený','Zrušený']
-    rows = []
-    for i in range(100):
-        start = DATE_START + datetime.timedelta(random.randint(0, 800))
-        end = start + datetime.timedelta(random.randint(30, 730))
-        rows.append((f'PROJ{i+1:03d}', fake.catch_phrase()[:50], random.choice(stavy),
-                      round(random.uniform(50000, 5000000), 2), start, end,
-                      random.choice(['Interní','Zákaznický','R&D','Investiční','Údržba'])))
-    return save(pd.DataFrame(rows, columns=['projekt_id','projekt_nazev','stav','rozpocet','datum_zahajeni','datum_ukonceni','typ']),
-                'dim_projekty.csv')
+    n = 100
+    start = shift_days(DATE_START, rng.integers(0, 801, n))
+    end = start + rng.integers(30, 731, n).astype('timedelta64[D]')
+    return save(pd.DataFrame({
+        'projekt_id': make_ids('PROJ', n, 3),
+        'projekt_nazev': [s[:50] for s in rng.choice(faker_pool('catch_phrase'), n, replace=False)],
+        'stav': rng.choice(stavy, n),
+        'rozpocet': round2(rng.uniform(50000, 5000000, n)),
+        'datum_zahajeni': start.astype(str),
+        'datum_ukonceni': end.astype(str),
+        'typ': rng.choice(['Interní','Zákaznický','R&D','Investiční','Údržba'], n),
+    }), 'dim_projekty.csv')
 
 def gen_ucty():
     """Generates a chart of accounts (účtový rozvrh) – Czech accounting standard."""
@@ -178,329 +319,355 @@ def gen_ucty():
         (641, 5, '6', 'Ostatní provozní V {}', 'Výnosy', 'Ostatní provozní výnosy'),
         (661, 5, '6', 'Finanční výnosy {}', 'Výnosy', 'Finanční výnosy'),
     ]
-    rows = []
-    for start_num, count, trida, tmpl, typ, skupina in groups:
-        for j in range(count):
-            num = start_num + j
-            rows.append((str(num).zfill(3), tmpl.format(j+1), typ, skupina, trida,
-                          random.choice(['aktivní','aktivní','neaktivní'])))
-    return save(pd.DataFrame(rows, columns=['ucet_cislo','ucet_nazev','typ','skupina','trida','stav']),
-                'dim_ucty.csv')
+    start_num, count, trida, tmpl, typ, skupina = (np.array(col) for col in zip(*groups))
+    # Position of each account within its group (0..count-1)
+    j = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    return save(pd.DataFrame({
+        'ucet_cislo': np.char.zfill((np.repeat(start_num, count) + j).astype(str), 3),
+        'ucet_nazev': [t.format(k + 1) for t, k in zip(np.repeat(tmpl, count), j)],
+        'typ': np.repeat(typ, count),
+        'skupina': np.repeat(skupina, count),
+        'trida': np.repeat(trida, count),
+        'stav': rng.choice(['aktivní','aktivní','neaktivní'], count.sum()),
+    }), 'dim_ucty.csv')
 
 def gen_zamestnanci(strediska):
     pozice = ['Analytik','Účetní','Manažer','Technik','Operátor','Obchodník','Programátor',
               'Ředitel','Asistent','Koordinátor','Správce','Specialista','Konzultant','Inženýr','Dispečer']
-    rows = []
-    for i in range(500):
-        nastup = DATE_START + datetime.timedelta(random.randint(-1500, 800))
-        rows.append((f'EMP{i+1:04d}', fake.first_name(), fake.last_name(),
-                      random.choice(strediska['stredisko_id'].tolist()),
-                      random.choice(pozice),
-                      round(random.uniform(28000, 120000), 0),
-                      nastup.isoformat(),
-                      random.choice(['Aktivní']*9 + ['Neaktivní']),
-                      random.choice(['Plný úvazek']*8 + ['Částečný úvazek','DPP']),
-                      fake.email()))
-    return save(pd.DataFrame(rows, columns=['zamestnanec_id','jmeno','prijmeni','stredisko_id',
-                'pozice','hruba_mzda','datum_nastupu','stav','typ_uvazku','email']),
-                'dim_zamestnanci.csv')
+    n = 500
+    return save(pd.DataFrame({
+        'zamestnanec_id': make_ids('EMP', n, 4),
+        'jmeno': rng.choice(faker_pool('first_name'), n),
+        'prijmeni': rng.choice(faker_pool('last_name'), n),
+        'stredisko_id': rng.choice(strediska['stredisko_id'].to_numpy(), n),
+        'pozice': rng.choice(pozice, n),
+        'hruba_mzda': np.round(rng.uniform(28000, 120000, n)),
+        'datum_nastupu': shift_days(DATE_START, rng.integers(-1500, 801, n)).astype(str),
+        'stav': rng.choice(['Aktivní']*9 + ['Neaktivní'], n),
+        'typ_uvazku': rng.choice(['Plný úvazek']*8 + ['Částečný úvazek','DPP'], n),
+        'email': rng.choice(faker_pool('email'), n, replace=False),
+    }), 'dim_zamestnanci.csv')
 
 def gen_produkty():
     kategorie = ['Elektronika','Strojírenství','Software','Služby','Chemie',
                   'Potraviny','Textil','Stavebnictví','Automotive','Energie']
-    rows = []
-    for i in range(300):
-        cena = round(random.uniform(50, 50000), 2)
-        marze = random.uniform(0.1, 0.6)
-        rows.append((f'PRD{i+1:04d}', fake.catch_phrase()[:40],
-                      random.choice(kategorie), cena,
-                      round(cena * (1 - marze), 2),
-                      random.choice(['ks','kg','l','m','hod','bal']),
-                      random.choice(['Aktivní']*8 + ['Ukončený','Plánovaný'])))
-    return save(pd.DataFrame(rows, columns=['produkt_id','produkt_nazev','kategorie',
-                'prodejni_cena','nakladova_cena','jednotka','stav']),
-                'dim_produkty.csv')
+    n = 300
+    cena = round2(rng.uniform(50, 50000, n))
+    marze = rng.uniform(0.1, 0.6, n)
+    return save(pd.DataFrame({
+        'produkt_id': make_ids('PRD', n, 4),
+        'produkt_nazev': [s[:40] for s in rng.choice(faker_pool('catch_phrase'), n, replace=False)],
+        'kategorie': rng.choice(kategorie, n),
+        'prodejni_cena': cena,
+        'nakladova_cena': round2(cena * (1 - marze)),
+        'jednotka': rng.choice(['ks','kg','l','m','hod','bal'], n),
+        'stav': rng.choice(['Aktivní']*8 + ['Ukončený','Plánovaný'], n),
+    }), 'dim_produkty.csv')
 
 def gen_zakaznici(regiony):
     segmenty = ['Enterprise','SMB','Retail','Government','Non-profit']
-    rows = []
-    for i in range(200):
-        rows.append((f'CUS{i+1:04d}', fake.company()[:50],
-                      random.choice(segmenty),
-                      random.choice(regiony['region_id'].tolist()),
-                      fake.street_address(), fake.city(),
-                      random.choice(['Aktivní']*8 + ['Neaktivní','Prospect']),
-                      round(random.uniform(10000, 5000000), 2),
-                      random.choice(['NET30','NET60','NET90','COD'])))
-    return save(pd.DataFrame(rows, columns=['zakaznik_id','zakaznik_nazev','segment','region_id',
-                'adresa','mesto','stav','kreditni_limit','platebni_podminky']),
-                'dim_zakaznici.csv')
+    n = 200
+    return save(pd.DataFrame({
+        'zakaznik_id': make_ids('CUS', n, 4),
+        'zakaznik_nazev': rng.choice(faker_pool('company'), n, replace=False),
+        'segment': rng.choice(segmenty, n),
+        'region_id': rng.choice(regiony['region_id'].to_numpy(), n),
+        'adresa': rng.choice(faker_pool('address'), n),
+        'mesto': rng.choice(faker_pool('city'), n),
+        'stav': rng.choice(['Aktivní']*8 + ['Neaktivní','Prospect'], n),
+        'kreditni_limit': round2(rng.uniform(10000, 5000000, n)),
+        'platebni_podminky': rng.choice(['NET30','NET60','NET90','COD'], n),
+    }), 'dim_zakaznici.csv')
 
 def gen_dodavatele():
     kategorie = ['Materiál','Služby','IT','Logistika','Energie','Suroviny','Údržba','Marketing']
-    rows = []
-    for i in range(100):
-        rows.append((f'SUP{i+1:03d}', fake.company()[:50],
-                      random.choice(kategorie),
-                      random.choice(['A','A','B','B','C']),
-                      fake.street_address(), fake.city(),
-                      random.choice(['CZ','CZ','CZ','SK','DE','AT']),
-                      random.choice(['Aktivní']*8 + ['Neaktivní','Blokovaný']),
-                      random.choice(['NET30','NET45','NET60','Předem'])))
-    return save(pd.DataFrame(rows, columns=['dodavatel_id','dodavatel_nazev','kategorie',
-                'hodnoceni','adresa','mesto','zeme','stav','platebni_podminky']),
-                'dim_dodavatele.csv')
+    n = 100
+    return save(pd.DataFrame({
+        'dodavatel_id': make_ids('SUP', n, 3),
+        'dodavatel_nazev': rng.choice(faker_pool('company'), n, replace=False),
+        'kategorie': rng.choice(kategorie, n),
+        'hodnoceni': rng.choice(['A','A','B','B','C'], n),
+        'adresa': rng.choice(faker_pool('address'), n),
+        'mesto': rng.choice(faker_pool('city'), n),
+        'zeme': rng.choice(['CZ','CZ','CZ','SK','DE','AT'], n),
+        'stav': rng.choice(['Aktivní']*8 + ['Neaktivní','Blokovaný'], n),
+        'platebni_podminky': rng.choice(['NET30','NET45','NET60','Předem'], n),
+    }), 'dim_dodavatele.csv')
 
 # ============================================================
 # 2. FACT TABLES
 # ============================================================
 
-def gen_transakce(ucty, strediska, projekty, profit_centra, pobocky, n=500000):
+def dim_arrays(ucty, strediska, projekty, profit_centra, pobocky, produkty, zakaznici, dodavatele):
+    """Key columns (and derived subsets) of the dimension tables as NumPy arrays.
+
+    Built once after the dimensions exist and shared by the fact generators,
+    which only ever sample from these columns.
+    """
+    vyr_produkty = produkty.loc[produkty['kategorie'].isin(
+        ['Elektronika','Strojírenství','Chemie','Automotive','Textil','Stavebnictví']), 'produkt_id']
+    if vyr_produkty.empty:
+        vyr_produkty = produkty['produkt_id'][:50]
+    str_vyr = strediska.loc[strediska['typ'] == 'Výroba', 'stredisko_id']
+    if str_vyr.empty:
+        str_vyr = strediska['stredisko_id'][:10]
+    ucet_fin = ucty.loc[ucty['skupina'] == 'Finanční účty', 'ucet_cislo']
+    if ucet_fin.empty:
+        ucet_fin = ucty['ucet_cislo'][:10]
+    return {
+        'ucet': ucty['ucet_cislo'].to_numpy(),
+        'ucet_financni': ucet_fin.to_numpy(),
+        'ucet_budget': ucty.loc[ucty['typ'].isin(['Náklady','Výnosy']), 'ucet_cislo'].to_numpy(),
+        'stredisko': strediska['stredisko_id'].to_numpy(),
+        'stredisko_vyroba': str_vyr.to_numpy(),
+        'projekt': projekty['projekt_id'].to_numpy(),
+        'profit_centrum': profit_centra['profit_centrum_id'].to_numpy(),
+        'pobocka': pobocky['pobocka_id'].to_numpy(),
+        'produkt': produkty['produkt_id'].to_numpy(),
+        'produkt_cena': produkty['prodejni_cena'].to_numpy(dtype=float),
+        'produkt_naklad': produkty['nakladova_cena'].to_numpy(dtype=float),
+        'produkt_vyroba': vyr_produkty.to_numpy(),
+        'zakaznik': zakaznici['zakaznik_id'].to_numpy(),
+        'dodavatel': dodavatele['dodavatel_id'].to_numpy(),
+    }
+
+def gen_transakce(dims, n=500000):
     """Main accounting transactions."""
     print(f"\n  Generating {n:,} transactions...")
-    typy_dokladu = ['FAP','FAP','FAV','FAV','FAV','PPD','VPD','BV','BV','INT','OPR','ZAL','DOB','STR']
-    meny = ['CZK']*80 + ['EUR']*15 + ['USD']*5
-    dph_sazby = [0.21, 0.21, 0.21, 0.15, 0.15, 0.10, 0.0]
-    kurzy = {'CZK': 1.0, 'EUR': 24.5, 'USD': 22.8}
-
-    ucet_list = ucty['ucet_cislo'].tolist()
-    str_list = strediska['stredisko_id'].tolist()
-    proj_list = projekty['projekt_id'].tolist()
-    pc_list = profit_centra['profit_centrum_id'].tolist()
-    pob_list = pobocky['pobocka_id'].tolist()
-
-    chunk_size = 50000
-    chunks = []
-    tx_id = 1
-
-    for chunk_start in range(0, n, chunk_size):
-        cn = min(chunk_size, n - chunk_start)
-        dates = seasonal_dates(cn)
-        castky_base = np.abs(np.random.lognormal(mean=8, sigma=2, size=cn)).round(2)
-        castky_base = np.clip(castky_base, 10, 50000000)
-
-        rows = []
-        for i in range(cn):
-            mena = random.choice(meny)
-            dph_sazba = random.choice(dph_sazby)
-            castka = float(castky_base[i])
-            dph = round(castka * dph_sazba, 2)
-            typ_dokladu = random.choice(typy_dokladu)
-            ucet_md = random.choice(ucet_list)
-            ucet_dal = random.choice(ucet_list)
-            while ucet_dal == ucet_md:
-                ucet_dal = random.choice(ucet_list)
-
-            rows.append((
-                f'TX{tx_id:07d}', dates[i].isoformat(), typ_dokladu,
-                castka, mena, kurzy[mena], round(castka * kurzy[mena], 2),
-                dph_sazba, dph,
-                ucet_md, ucet_dal,
-                random.choice(str_list), random.choice(proj_list),
-                random.choice(pc_list), random.choice(pob_list),
-                fake.sentence(nb_words=4)[:60] if random.random() < 0.3 else '',
-                random.choice(['Zaúčtováno','Zaúčtováno','Zaúčtováno','Koncept','Storno']),
-                f'USR{random.randint(1,50):03d}',
-            ))
-            tx_id += 1
-
-        chunks.append(pd.DataFrame(rows, columns=[
-            'transakce_id','datum','typ_dokladu','castka','mena','kurz','castka_czk',
-            'dph_sazba','dph_castka','ucet_md','ucet_dal','stredisko_id','projekt_id',
-            'profit_centrum_id','pobocka_id','popis','stav','uzivatel']))
-
-        print(f"    chunk {chunk_start+cn:>10,}/{n:,}")
-
-    df = pd.concat(chunks, ignore_index=True)
-    return save(df, 'fact_transakce.csv')
+    typy_dokladu = np.array(['FAP','FAP','FAV','FAV','FAV','PPD','VPD','BV','BV','INT','OPR','ZAL','DOB','STR'])
+    dph_sazby = np.array([0.21, 0.21, 0.21, 0.15, 0.15, 0.10, 0.0])
+    stavy = np.array(['Zaúčtováno','Zaúčtováno','Zaúčtováno','Koncept','Storno'])
+    # Currencies are drawn as indices into these tables so the rate lookup vectorizes
+    meny = np.array(['CZK', 'EUR', 'USD'])
+    meny_p = np.array([0.80, 0.15, 0.05])
+    kurzy = np.array([1.0, 24.5, 22.8])
+
+    ucet_arr = dims['ucet']
+    vety = faker_pool('sentence')
+
+    def chunks(chunk_size=50000):
+        for chunk_start in range(0, n, chunk_size):
+            cn = min(chunk_size, n - chunk_start)
+            dates = seasonal_dates(cn)
+            castky_base = round2(np.abs(rng.lognormal(mean=8, sigma=2, size=cn)))
+            castky_base = np.clip(castky_base, 10, 50000000)
+
+            mena_idx = rng.choice(len(meny), size=cn, p=meny_p)
+            kurz = kurzy[mena_idx]
+            dph_sazba = rng.choice(dph_sazby, size=cn)
+
+            ucet_md = rng.choice(ucet_arr, size=cn)
+            ucet_dal = rng.choice(ucet_arr, size=cn)
+            mask = ucet_md == ucet_dal
+            while mask.any():
+                ucet_dal[mask] = rng.choice(ucet_arr, size=int(mask.sum()))
+                mask = ucet_md == ucet_dal
+
+            yield pd.DataFrame({
+                'transakce_id': make_ids('TX', cn, 7, start=chunk_start + 1),
+                'datum': dates.astype(str),
+                'typ_dokladu': choice_categorical(typy_dokladu, cn),
+                'castka': castky_base,
+                'mena': pd.Categorical.from_codes(mena_idx, categories=meny),
+                'kurz': kurz,
+                'castka_czk': round2(castky_base * kurz),
+                'dph_sazba': dph_sazba,
+                'dph_castka': round2(castky_base * dph_sazba),
+                'ucet_md': ucet_md,
+                'ucet_dal': ucet_dal,
+                'stredisko_id': rng.choice(dims['stredisko'], size=cn),
+                'projekt_id': rng.choice(dims['projekt'], size=cn),
+                'profit_centrum_id': rng.choice(dims['profit_centrum'], size=cn),
+                'pobocka_id': rng.choice(dims['pobocka'], size=cn),
+                'popis': np.where(rng.random(cn) < 0.3, rng.choice(vety, cn), ''),
+                'stav': choice_categorical(stavy, cn),
+                'uzivatel': choice_categorical(make_ids('USR', 50, 3), cn),
+            })
+
+            print(f"    chunk {chunk_start+cn:>10,}/{n:,}")
+
+    save_chunks(chunks(), 'fact_transakce.csv')
 
 def gen_mzdy(zamestnanci):
     """Payroll data – monthly for each active employee."""
-    rows = []
     emps = zamestnanci[zamestnanci['stav'] == 'Aktivní']
-    for _, emp in emps.iterrows():
-        hruba = float(emp['hruba_mzda'])
-        for year in range(2023, 2026):
-            for month in range(1, 13):
-                soc_zam = round(hruba * 0.065, 2)  # employee social
-                zdr_zam = round(hruba * 0.045, 2)  # employee health
-                soc_firm = round(hruba * 0.248, 2)  # employer social
-                zdr_firm = round(hruba * 0.09, 2)   # employer health
-                dan = round(max(0, (hruba - soc_zam - zdr_zam) * 0.15), 2)
-                cista = round(hruba - soc_zam - zdr_zam - dan, 2)
-                odmena = round(random.uniform(0, hruba * 0.15), 2) if random.random() < 0.2 else 0
-                rows.append((
-                    emp['zamestnanec_id'], emp['stredisko_id'], f'{year}-{month:02d}',
-                    hruba, odmena, hruba + odmena,
-                    soc_zam, zdr_zam, soc_firm, zdr_firm, dan,
-                    cista + odmena * 0.7,
-                    round(hruba + odmena + soc_firm + zdr_firm, 2)
-                ))
-    return save(pd.DataFrame(rows, columns=[
-        'zamestnanec_id','stredisko_id','obdobi','zakladni_mzda','odmeny','hruba_mzda_celkem',
-        'soc_pojisteni_zam','zdr_pojisteni_zam','soc_pojisteni_firma','zdr_pojisteni_firma',
-        'dan_z_prijmu','cista_mzda','celkove_naklady_firma']),
-        'fact_mzdy.csv')
-
-def gen_prodeje(zakaznici, produkty, pobocky, n=100000):
+    n_emp, n_per = len(emps), len(OBDOBI)
+
+    # One row per (employee, period), employee-major
+    hruba = np.repeat(emps['hruba_mzda'].to_numpy(dtype=float), n_per)
+    soc_zam, zdr_zam, soc_firm, zdr_firm, dan, cista = payroll_taxes(hruba)
+    odmena = round2(np.where(rng.random(hruba.size) < 0.2, rng.uniform(0, hruba * 0.15), 0.0))
+
+    return save(pd.DataFrame({
+        'zamestnanec_id': np.repeat(emps['zamestnanec_id'].to_numpy(), n_per),
+        'stredisko_id': np.repeat(emps['stredisko_id'].to_numpy(), n_per),
+        'obdobi': np.tile(OBDOBI, n_emp),
+        'zakladni_mzda': hruba,
+        'odmeny': odmena,
+        'hruba_mzda_celkem': hruba + odmena,
+        'soc_pojisteni_zam': soc_zam,
+        'zdr_pojisteni_zam': zdr_zam,
+        'soc_pojisteni_firma': soc_firm,
+        'zdr_pojisteni_firma': zdr_firm,
+        'dan_z_prijmu': dan,
+        'cista_mzda': cista + odmena * 0.7,
+        'celkove_naklady_firma': round2(hruba + odmena + soc_firm + zdr_firm),
+    }), 'fact_mzdy.csv')
+
+def gen_prodeje(dims, n=100000):
     """Sales / revenue data."""
-    zak_list = zakaznici['zakaznik_id'].tolist()
-    prod_df = produkty[['produkt_id','prodejni_cena','nakladova_cena']].values.tolist()
-    pob_list = pobocky['pobocka_id'].tolist()
-    kanaly = ['E-shop','Pobočka','Telefon','B2B portál','Obchodní zástupce']
+    kanaly = np.array(['E-shop','Pobočka','Telefon','B2B portál','Obchodní zástupce'])
+    stavy = np.array(['Zaplaceno','Zaplaceno','Zaplaceno','Nezaplaceno','Částečně','Storno'])
 
-    rows = []
     dates = seasonal_dates(n)
-    for i in range(n):
-        prod = random.choice(prod_df)
-        mnozstvi = random.randint(1, 100)
-        cena = float(prod[1])
-        sleva_pct = random.choice([0,0,0,0,5,10,15,20]) / 100
-        dph = random.choice([0.21, 0.15, 0.10])
-        celkem_bez_dph = round(mnozstvi * cena * (1 - sleva_pct), 2)
-        rows.append((
-            f'FAV{i+1:07d}', dates[i].isoformat(),
-            random.choice(zak_list), prod[0], mnozstvi, cena,
-            sleva_pct, celkem_bez_dph,
-            dph, round(celkem_bez_dph * dph, 2), round(celkem_bez_dph * (1 + dph), 2),
-            round(mnozstvi * float(prod[2]), 2),
-            random.choice(pob_list), random.choice(kanaly),
-            random.choice(['Zaplaceno','Zaplaceno','Zaplaceno','Nezaplaceno','Částečně','Storno']),
-            random.choice(['CZK']*85 + ['EUR']*15),
-        ))
-        if (i+1) % 25000 == 0:
-            print(f"    sales {i+1:>10,}/{n:,}")
-
-    return save(pd.DataFrame(rows, columns=[
-        'faktura_id','datum','zakaznik_id','produkt_id','mnozstvi','jednotkova_cena',
-        'sleva_pct','celkem_bez_dph','dph_sazba','dph_castka','celkem_s_dph',
-        'nakladova_cena_celkem','pobocka_id','kanal','stav_platby','mena']),
-        'fact_prodeje.csv')
-
-def gen_nakupy(dodavatele, produkty, strediska, n=50000):
+    prod_idx = rng.integers(0, len(dims['produkt']), n)
+    mnozstvi = rng.integers(1, 101, n)
+    cena = dims['produkt_cena'][prod_idx]
+    sleva_pct = rng.choice(np.array([0, 0, 0, 0, 5, 10, 15, 20]), n) / 100
+    dph = rng.choice(np.array([0.21, 0.15, 0.10]), n)
+    celkem_bez_dph = round2(mnozstvi * cena * (1 - sleva_pct))
+    naklad = dims['produkt_naklad'][prod_idx]
+
+    return save(pd.DataFrame({
+        'faktura_id': make_ids('FAV', n, 7),
+        'datum': dates.astype(str),
+        'zakaznik_id': rng.choice(dims['zakaznik'], n),
+        'produkt_id': dims['produkt'][prod_idx],
+        'mnozstvi': mnozstvi,
+        'jednotkova_cena': cena,
+        'sleva_pct': sleva_pct,
+        'celkem_bez_dph': celkem_bez_dph,
+        'dph_sazba': dph,
+        'dph_castka': round2(celkem_bez_dph * dph),
+        'celkem_s_dph': round2(celkem_bez_dph * (1 + dph)),
+        'nakladova_cena_celkem': round2(mnozstvi * naklad),
+        'pobocka_id': rng.choice(dims['pobocka'], n),
+        'kanal': choice_categorical(kanaly, n),
+        'stav_platby': choice_categorical(stavy, n),
+        'mena': choice_categorical(['CZK', 'EUR'], n, p=[0.85, 0.15]),
+    }), 'fact_prodeje.csv')
+
+def gen_nakupy(dims, n=50000):
     """Purchase / procurement data."""
-    dod_list = dodavatele['dodavatel_id'].tolist()
-    str_list = strediska['stredisko_id'].tolist()
-    typy_pol = ['Materiál','Služba','Energie','Náhradní díly','Kancelářské potřeby',
-                'IT vybavení','Software licence','Doprava','Údržba','Suroviny']
+    typy_pol = np.array(['Materiál','Služba','Energie','Náhradní díly','Kancelářské potřeby',
+                         'IT vybavení','Software licence','Doprava','Údržba','Suroviny'])
+    stavy = np.array(['Schváleno','Schváleno','Přijato','Částečně přijato','Reklamace','Koncept'])
 
-    rows = []
     dates = random_dates(n)
-    for i in range(n):
-        mnozstvi = random.randint(1, 500)
-        cena = round(random.uniform(20, 25000), 2)
-        dph = random.choice([0.21, 0.15, 0.10, 0.0])
-        celkem = round(mnozstvi * cena, 2)
-        rows.append((
-            f'OBJ{i+1:06d}', dates[i].isoformat(),
-            random.choice(dod_list), random.choice(typy_pol),
-            mnozstvi, cena, celkem, dph, round(celkem * dph, 2), round(celkem * (1 + dph), 2),
-            random.choice(str_list),
-            random.choice(['Schváleno','Schváleno','Přijato','Částečně přijato','Reklamace','Koncept']),
-            random.choice(['CZK']*85 + ['EUR']*10 + ['USD']*5),
-        ))
-        if (i+1) % 10000 == 0:
-            print(f"    purchases {i+1:>10,}/{n:,}")
-
-    return save(pd.DataFrame(rows, columns=[
-        'objednavka_id','datum','dodavatel_id','typ_polozky','mnozstvi','jednotkova_cena',
-        'celkem_bez_dph','dph_sazba','dph_castka','celkem_s_dph','stredisko_id','stav','mena']),
-        'fact_nakupy.csv')
-
-def gen_vyrobni_zakazky(produkty, strediska, n=20000):
+    mnozstvi = rng.integers(1, 501, n)
+    cena = round2(rng.uniform(20, 25000, n))
+    dph = rng.choice(np.array([0.21, 0.15, 0.10, 0.0]), n)
+    celkem = round2(mnozstvi * cena)
+
+    return save(pd.DataFrame({
+        'objednavka_id': make_ids('OBJ', n, 6),
+        'datum': dates.astype(str),
+        'dodavatel_id': rng.choice(dims['dodavatel'], n),
+        'typ_polozky': choice_categorical(typy_pol, n),
+        'mnozstvi': mnozstvi,
+        'jednotkova_cena': cena,
+        'celkem_bez_dph': celkem,
+        'dph_sazba': dph,
+        'dph_castka': round2(celkem * dph),
+        'celkem_s_dph': round2(celkem * (1 + dph)),
+        'stredisko_id': rng.choice(dims['stredisko'], n),
+        'stav': choice_categorical(stavy, n),
+        'mena': choice_categorical(['CZK', 'EUR', 'USD'], n, p=[0.85, 0.10, 0.05]),
+    }), 'fact_nakupy.csv')
+
+def gen_vyrobni_zakazky(dims, n=20000):
     """Production / manufacturing orders."""
-    vyr_produkty = produkty[produkty['kategorie'].isin(
-        ['Elektronika','Strojírenství','Chemie','Automotive','Textil','Stavebnictví'])
-    ]['produkt_id'].tolist()
-    if not vyr_produkty:
-        vyr_produkty = produkty['produkt_id'].tolist()[:50]
-    str_vyr = strediska[strediska['typ'] == 'Výroba']['stredisko_id'].tolist()
-    if not str_vyr:
-        str_vyr = strediska['stredisko_id'].tolist()[:10]
-    stavy = ['Plánováno','V výrobě','V výrobě','Dokončeno','Dokončeno','Dokončeno','Pozastaveno','Zrušeno']
-
-    rows = []
-    for i in range(n):
-        start = DATE_START + datetime.timedelta(random.randint(0, 900))
-        dur = random.randint(1, 45)
-        mnozstvi = random.randint(10, 5000)
-        mat_cost = round(random.uniform(1000, 500000), 2)
-        labor_cost = round(mat_cost * random.uniform(0.2, 0.8), 2)
-        overhead = round((mat_cost + labor_cost) * random.uniform(0.05, 0.25), 2)
-        rows.append((
-            f'VZ{i+1:06d}', random.choice(vyr_produkty), mnozstvi,
-            start.isoformat(), (start + datetime.timedelta(dur)).isoformat(),
-            random.choice(str_vyr), mat_cost, labor_cost, overhead,
-            round(mat_cost + labor_cost + overhead, 2),
-            random.choice(stavy), round(random.uniform(0.85, 1.05), 3),
-            random.randint(0, int(mnozstvi * 0.05)),
-        ))
-
-    return save(pd.DataFrame(rows, columns=[
-        'zakazka_id','produkt_id','planovane_mnozstvi','datum_zahajeni','datum_ukonceni',
-        'stredisko_id','naklady_material','naklady_prace','naklady_rezie',
-        'celkove_naklady','stav','vyuziti_kapacity','zmetky']),
-        'fact_vyrobni_zakazky.csv')
-
-def gen_cashflow(pobocky, ucty, n=80000):
+    stavy = np.array(['Plánováno','V výrobě','V výrobě','Dokončeno','Dokončeno','Dokončeno','Pozastaveno','Zrušeno'])
+
+    start = shift_days(DATE_START, rng.integers(0, 901, n))
+    dur = rng.integers(1, 46, n).astype('timedelta64[D]')
+    mnozstvi = rng.integers(10, 5001, n)
+    mat_cost = round2(rng.uniform(1000, 500000, n))
+    labor_cost = round2(mat_cost * rng.uniform(0.2, 0.8, n))
+    overhead = round2((mat_cost + labor_cost) * rng.uniform(0.05, 0.25, n))
+    vyuziti = rng.uniform(0.85, 1.05, n)
+
+    return save(pd.DataFrame({
+        'zakazka_id': make_ids('VZ', n, 6),
+        'produkt_id': rng.choice(dims['produkt_vyroba'], n),
+        'planovane_mnozstvi': mnozstvi,
+        'datum_zahajeni': start.astype(str),
+        'datum_ukonceni': (start + dur).astype(str),
+        'stredisko_id': rng.choice(dims['stredisko_vyroba'], n),
+        'naklady_material': mat_cost,
+        'naklady_prace': labor_cost,
+        'naklady_rezie': overhead,
+        'celkove_naklady': round2(mat_cost + labor_cost + overhead),
+        'stav': choice_categorical(stavy, n),
+        'vyuziti_kapacity': np.round(vyuziti, 3, out=vyuziti),
+        'zmetky': rng.integers(0, (mnozstvi * 0.05).astype(int) + 1),
+    }), 'fact_vyrobni_zakazky.csv')
+
+def gen_cashflow(dims, n=80000):
     """Cash flow data."""
     typy = ['Příjem z prodeje','Příjem z prodeje','Příjem z prodeje',
             'Platba dodavateli','Platba dodavateli','Mzdy','Daně','Splátka úvěru',
             'Úroky','Investice','Příjem úvěru','Dividendy','Ostatní příjem','Ostatní výdaj']
-    pob_list = pobocky['pobocka_id'].tolist()
-    ucet_list = ucty[ucty['skupina'] == 'Finanční účty']['ucet_cislo'].tolist()
-    if not ucet_list:
-        ucet_list = ucty['ucet_cislo'].tolist()[:10]
 
-    rows = []
     dates = seasonal_dates(n)
-    for i in range(n):
-        typ = random.choice(typy)
-        is_income = typ in ('Příjem z prodeje','Příjem úvěru','Ostatní příjem','Dividendy')
-        castka = round(random.uniform(500, 2000000), 2)
-        rows.append((
-            f'CF{i+1:06d}', dates[i].isoformat(), typ,
-            'Příjem' if is_income else 'Výdaj',
-            castka if is_income else -castka,
-            random.choice(ucet_list), random.choice(pob_list),
-            random.choice(['CZK']*85 + ['EUR']*15),
-            random.choice(['Realizováno','Realizováno','Realizováno','Plánováno']),
-        ))
-
-    return save(pd.DataFrame(rows, columns=[
-        'cashflow_id','datum','typ_pohybu','smer','castka','ucet','pobocka_id','mena','stav']),
-        'fact_cashflow.csv')
-
-def gen_budget(strediska, ucty):
+    typ = choice_categorical(typy, n)
+    is_income = typ.isin(['Příjem z prodeje','Příjem úvěru','Ostatní příjem','Dividendy'])
+    castka = round2(rng.uniform(500, 2000000, n))
+
+    return save(pd.DataFrame({
+        'cashflow_id': make_ids('CF', n, 6),
+        'datum': dates.astype(str),
+        'typ_pohybu': typ,
+        'smer': pd.Categorical.from_codes((~is_income).astype(np.int8), categories=['Příjem', 'Výdaj']),
+        'castka': np.where(is_income, castka, -castka),
+        'ucet': rng.choice(dims['ucet_financni'], n),
+        'pobocka_id': rng.choice(dims['pobocka'], n),
+        'mena': choice_categorical(['CZK', 'EUR'], n, p=[0.85, 0.15]),
+        'stav': choice_categorical(['Realizováno','Realizováno','Realizováno','Plánováno'], n),
+    }), 'fact_cashflow.csv')
+
+def gen_budget(dims):
     """Budget vs actual per cost center, account, and month."""
-    str_list = strediska['stredisko_id'].tolist()
+    str_arr = dims['stredisko']
     # Use subset of accounts for budgeting (costs & revenues)
-    budget_ucty = ucty[ucty['typ'].isin(['Náklady','Výnosy'])]['ucet_cislo'].tolist()
+    budget_ucty = dims['ucet_budget']
     if len(budget_ucty) > 40:
-        budget_ucty = random.sample(budget_ucty, 40)
-
-    rows = []
-    for strid in str_list:
-        for ucet in random.sample(budget_ucty, min(8, len(budget_ucty))):
-            for year in range(2023, 2026):
-                for month in range(1, 13):
-                    plan = round(random.uniform(5000, 500000), 2)
-                    skutecnost = round(plan * random.uniform(0.7, 1.3), 2)
-                    rows.append((
-                        strid, ucet, f'{year}-{month:02d}',
-                        plan, skutecnost, round(skutecnost - plan, 2),
-                        round((skutecnost - plan) / plan * 100, 1),
-                    ))
-
-    return save(pd.DataFrame(rows, columns=[
-        'stredisko_id','ucet_cislo','obdobi','plan','skutecnost','odchylka','odchylka_pct']),
-        'fact_budget.csv')
+        budget_ucty = rng.choice(budget_ucty, 40, replace=False)
+
+    # (cost center x account x period) product; each center gets its own k accounts
+    k = min(8, len(budget_ucty))
+    ucty_mat = rng.permuted(np.tile(budget_ucty, (len(str_arr), 1)), axis=1)[:, :k]
+    n_per = len(OBDOBI)
+    n = ucty_mat.size * n_per
+
+    plan = round2(rng.uniform(5000, 500000, n))
+    skutecnost = round2(plan * rng.uniform(0.7, 1.3, n))
+    odchylka = round2(skutecnost - plan)
+    odchylka_pct = odchylka / plan * 100
+
+    return save(pd.DataFrame({
+        'stredisko_id': np.repeat(str_arr, k * n_per),
+        'ucet_cislo': np.repeat(ucty_mat.ravel(), n_per),
+        'obdobi': np.tile(OBDOBI, ucty_mat.size),
+        'plan': plan,
+        'skutecnost': skutecnost,
+        'odchylka': odchylka,
+        'odchylka_pct': np.round(odchylka_pct, 1, out=odchylka_pct),
+    }), 'fact_budget.csv')
 
 
 # ============================================================
 # MAIN
 # ============================================================
 
+def run_fact_task(gen, seed_seq, args, output_dir):
+    """Process-pool entry point: reseed this worker's Generator, then run one fact generator."""
+    global rng, OUTPUT_DIR
+    rng = np.random.default_rng(seed_seq)
+    OUTPUT_DIR = output_dir
+    gen(*args)
+    return gen.__name__
+
 def main():
     print("=" * 60)
     print("  FINANCIAL CONTROLLING DATASET GENERATOR")
@@ -520,13 +687,27 @@ def main():
     dodavatele = gen_dodavatele()
 
     print("\n── Fact Tables ──")
-    gen_transakce(ucty, strediska, projekty, profit_centra, pobocky)
-    gen_mzdy(zamestnanci)
-    gen_prodeje(zakaznici, produkty, pobocky)
-    gen_nakupy(dodavatele, produkty, strediska)
-    gen_vyrobni_zakazky(produkty, strediska)
-    gen_cashflow(pobocky, ucty)
-    gen_budget(strediska, ucty)
+    # Fact tables only depend on the dimensions, so they run in parallel with
+    # an independent, reproducible seed per table
+    dims = dim_arrays(ucty, strediska, projekty, profit_centra, pobocky, produkty, zakaznici, dodavatele)
+    tasks = [
+        (gen_transakce, (dims,)),
+        (gen_mzdy, (zamestnanci,)),
+        (gen_prodeje, (dims,)),
+        (gen_nakupy, (dims,)),
+        (gen_vyrobni_zakazky, (dims,)),
+        (gen_cashflow, (dims,)),
+        (gen_budget, (dims,)),
+    ]
+    seeds = np.random.SeedSequence(42).spawn(len(tasks))
+    # Spawned (not forked) workers: forking after polars has started
+    # their thread pools in this process can deadlock the children
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1),
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(run_fact_task, gen, seed, args, OUTPUT_DIR)
+                   for (gen, args), seed in zip(tasks, seeds)]
+        for future in as_completed(futures):
+            future.result()
 
     print("\n" + "=" * 60)
     print("  ALL DONE!")